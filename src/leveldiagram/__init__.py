@@ -1,6 +1,20 @@
 # import API elements here
 
+import importlib
+
 from .utils import ket_str, bra_str, about
-from .ld import LD
 
 
+def __getattr__(name):
+    # load LD and the matplotlib dependent submodules on first use
+    if name == "LD":
+        from .ld import LD
+
+        globals()["LD"] = LD
+        return LD
+    if name in ("ld", "artists"):
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["ket_str", "bra_str", "about", "LD"]
@@ -3,16 +3,143 @@ Customized matplotlib artist primitives
 """
 
 import matplotlib as mpl
+import matplotlib.axes
+import matplotlib.colors
+import matplotlib.patches
+import matplotlib.text
+import matplotlib.transforms
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
 import numpy as np
+import math
 import warnings
+from types import MappingProxyType
 
-from typing import Optional, Any, Union, Literal, Collection, Dict, Tuple
-
-from .utils import deep_update
+from typing import (
+    Optional, Any, Union, Literal, Collection, Sequence, Dict, List, Tuple
+)
 
 affine = mpl.transforms.Affine2D
 
+_label_pad = 6
+"Padding between an EnergyLevel and its text labels, in pixels"
+_label_offsets = {
+    side: affine().translate(dx, dy).frozen()
+    for side, (dx, dy) in {
+        "right": (_label_pad, 0),
+        "left": (-_label_pad, 0),
+        "top": (0, _label_pad),
+        "bottom": (0, -_label_pad),
+    }.items()
+}
+"Pixel offset transforms of EnergyLevel text labels, keyed by side"
+
+_axis_cos_sin = {
+    0.0: (1.0, 0.0),
+    math.pi / 2: (0.0, 1.0),
+    math.pi: (-1.0, 0.0),
+    -math.pi: (-1.0, 0.0),
+    -math.pi / 2: (0.0, -1.0),
+}
+"Exact cosine and sine of the angles returned by atan2 for axis-aligned vectors"
+
+_Points = Union[np.ndarray, Sequence[float]]
+"Coordinates given as either an array or a sequence of floats"
+
+_arrow_verts = np.array([[-1, 0.5], [-1, -0.5], [0, 0], [-1, 0.5]], dtype=float)
+"Unit arrowhead vertices shared by all Coupling instances"
+_arrow_verts.setflags(write=False)
+
+
+def _endpoint_array(point: Collection) -> np.ndarray:
+    """
+    Converts a coupling end point to a 2-element float array.
+
+    Raises:
+        RuntimeError: If `point` is not a sequence of two numbers.
+    """
+
+    try:
+        arr = np.asarray(point, dtype=float)
+    except (TypeError, ValueError):
+        arr = None
+    if arr is None or arr.shape != (2,):
+        raise RuntimeError("x/y data must be a sequence of two elements")
+    return arr
+
+
+def _geometry(start: _Points, stop: _Points) -> Tuple[float, float]:
+    """
+    Length and angle of the vector from `start` to `stop`.
+
+    Uses scalar math to avoid numpy overhead on 2-element vectors.
+
+    Returns:
+        tuple: length and angle (in radians) of the vector
+    """
+
+    dx = float(stop[0] - start[0])
+    dy = float(stop[1] - start[1])
+    return math.hypot(dx, dy), math.atan2(dy, dx)
+
+
+def _sine_wave(
+    x: np.ndarray, omega: float, phase: float, amp: float
+) -> np.ndarray:
+    """
+    Samples `amp*sin(omega*x + phase)`.
+
+    All operations are done in place on a single output array
+    to avoid intermediate temporaries.
+
+    Parameters:
+        x (numpy.ndarray): Points to sample the wave at
+        omega (float): Angular frequency of the wave
+        phase (float): Phase offset of the wave
+        amp (float): Amplitude of the wave
+
+    Returns:
+        numpy.ndarray: Sampled wave
+    """
+
+    out: np.ndarray = np.multiply(x, omega)
+    out += phase
+    np.sin(out, out=out)
+    out *= amp
+    return out
+
+
+def _level_labels(
+    energy: float,
+    xpos: float,
+    width: float,
+    right_text: str,
+    left_text: str,
+    top_text: str,
+    bottom_text: str,
+    text_kw: Dict[str, Any],
+) -> Dict[str, mpl.text.Text]:
+    """
+    Creates the text labels of a level.
+
+    Only sides with text get a label, to avoid creating empty artists.
+
+    Returns:
+        dict: Text label objects keyed by side
+    """
+
+    labels = {
+        "right": (xpos + width / 2, energy, right_text, "left", "center"),
+        "left": (xpos - width / 2, energy, left_text, "right", "center"),
+        "top": (xpos, energy, top_text, "center", "bottom"),
+        "bottom": (xpos, energy, bottom_text, "center", "top"),
+    }
+    return {
+        side: mpl.text.Text(x, y, text, ha=ha, va=va, **text_kw)
+        for side, (x, y, text, ha, va) in labels.items()
+        if text
+    }
+
 
 class EnergyLevel(Line2D):
     """
@@ -58,64 +185,60 @@ class EnergyLevel(Line2D):
         self._energy = energy
         self._xpos = xpos
         self._width = width
+        # anchor coordinates, as plain tuples to avoid allocating arrays per query
+        self._anchors: Dict[str, Tuple[float, float]] = {
+            "center": (float(xpos), float(energy)),
+            "left": (float(xpos - width / 2), float(energy)),
+            "right": (float(xpos + width / 2), float(energy)),
+        }
 
         if text_kw is None:
             text_kw = {}
         # we'll update the position when the line data is set
-        self.text_labels: Dict[str, mpl.text.Text] = {
-            "right": mpl.text.Text(
-                xpos + width / 2, energy, right_text, ha="left", va="center", **text_kw
-            ),
-            "left": mpl.text.Text(
-                xpos - width / 2, energy, left_text, ha="right", va="center", **text_kw
-            ),
-            "top": mpl.text.Text(
-                xpos, energy, top_text, ha="center", va="bottom", **text_kw
-            ),
-            "bottom": mpl.text.Text(
-                xpos, energy, bottom_text, ha="center", va="top", **text_kw
-            ),
-        }
-        """Text label objects to add to the level"""
+        self.text_labels: Dict[str, mpl.text.Text] = _level_labels(
+            energy, xpos, width, right_text, left_text, top_text, bottom_text, text_kw
+        )
+        """Text label objects to add to the level, keyed by side.
+        Sides without text are omitted."""
 
         x = (xpos - width / 2, xpos + width / 2)
         y = (energy, energy)
 
         super().__init__(x, y, **kwargs)
 
-    def get_center(self) -> np.ndarray:
+    def get_center(self) -> Tuple[float, float]:
         """
         Returns coordinates of the center of the level line.
 
         Returns:
-            numpy.ndarray: x,y coordinates
+            tuple: x,y coordinates
         """
 
-        return np.array((self._xpos, self._energy), dtype=float)
+        return self._anchors["center"]
 
-    def get_left(self) -> np.ndarray:
+    def get_left(self) -> Tuple[float, float]:
         """
         Returns coordinates of the left of the level line.
 
         Returns:
-            numpy.ndarray: x,y coordinates
+            tuple: x,y coordinates
         """
 
-        return np.array((self._xpos - self._width / 2, self._energy), dtype=float)
+        return self._anchors["left"]
 
-    def get_right(self) -> np.ndarray:
+    def get_right(self) -> Tuple[float, float]:
         """
         Returns coordinates of the right of the level line.
 
         Returns:
-            numpy.ndarray: x,y coordinates
+            tuple: x,y coordinates
         """
 
-        return np.array((self._xpos + self._width / 2, self._energy), dtype=float)
+        return self._anchors["right"]
 
     def get_anchor(
         self, loc: Union[Literal["center", "left", "right"], Collection] = "center"
-    ) -> np.ndarray:
+    ) -> Tuple[float, float]:
         """
         Returns an anchor on the level in plot coordinates.
 
@@ -125,23 +248,26 @@ class EnergyLevel(Line2D):
                 A 2-element iterable is interpreted as offsets from the center
                 location.
 
+        Returns:
+            tuple: x,y coordinates
+
         Raises:
             TypeError: If `loc` is not accepted string or a 2-element iterable.
         """
 
-        if loc == "center":
-            anchor = self.get_center()
-        elif loc == "left":
-            anchor = self.get_left()
-        elif loc == "right":
-            anchor = self.get_right()
+        if isinstance(loc, str):
+            try:
+                return self._anchors[loc]
+            except KeyError:
+                raise TypeError(
+                    "loc must be 'center', 'left', or 'right' if a string"
+                ) from None
+        elif len(loc) == 2:
+            x, y = self._anchors["center"]
+            dx, dy = tuple(loc)
+            return (x + dx, y + dy)
         else:
-            if len(loc) == 2:
-                anchor = self.get_center() + np.array(loc)
-            else:
-                raise TypeError("loc must iterable of two elements if not using keys")
-
-        return anchor
+            raise TypeError("loc must iterable of two elements if not using keys")
 
     def set_figure(self, figure):
         for side, label in self.text_labels.items():
@@ -153,20 +279,26 @@ class EnergyLevel(Line2D):
             label.set_axes(axes)
         super().set_axes(axes)
 
+    def get_children(self):
+        """
+        Overridden to include the text labels.
+        """
+        return [*super().get_children(), *self.text_labels.values()]
+
+    def set_animated(self, b):
+        """
+        Overridden to also set the text labels as animated.
+        """
+        for label in self.text_labels.values():
+            label.set_animated(b)
+        super().set_animated(b)
+
     def set_transform(self, transform):
         """
         Overridden to add padding offsets to labels.
         """
-        # pixel offsets
-        pad = 6
-        offsets = {
-            "right": (pad, 0),
-            "left": (-pad, 0),
-            "top": (0, pad),
-            "bottom": (0, -pad),
-        }
         for side, label in self.text_labels.items():
-            label.set_transform(transform + affine().translate(*offsets[side]))
+            label.set_transform(transform + _label_offsets[side])
         super().set_transform(transform)
 
     def set_data(self, x, y):
@@ -180,6 +312,225 @@ class EnergyLevel(Line2D):
             label.draw(renderer)
 
 
+class EnergyLevelCollection(LineCollection):
+    """
+    Collection of energy levels drawn as a single artist.
+
+    Each :class:`EnergyLevel` is drawn separately,
+    so per-artist overhead dominates drawing diagrams with many levels.
+    This collection draws all of the level lines with a single call.
+    Text labels are only created for levels that have text.
+    """
+
+    def __str__(self):
+        return "EnergyLevelCollection(%d)" % len(self._energies)
+
+    def __init__(
+        self,
+        energies: Collection,
+        xpositions: Collection,
+        widths: Union[float, Collection],
+        right_text: Optional[Sequence[str]] = None,
+        left_text: Optional[Sequence[str]] = None,
+        top_text: Optional[Sequence[str]] = None,
+        bottom_text: Optional[Sequence[str]] = None,
+        text_kw: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        """
+        Parameters:
+            energies (collection of float): y-axis positions of the levels
+            xpositions (collection of float): x-axis positions of the levels
+            widths (float or collection of float): Widths of the level lines,
+                in units of the x-axis
+            right_text (sequence of str, optional): Text to put to the right of each level
+            left_text (sequence of str, optional): Text to put to the left of each level
+            top_text (sequence of str, optional): Text to put above each level
+            bottom_text (sequence of str, optional): Text to put below each level
+            text_kw (dict, optional): Dictionary of keyword-arguments passed to
+                :class:`matplotlib:matplotlib.text.Text`
+            kwargs: Passed to the
+                :class:`matplotlib:matplotlib.collections.LineCollection` constructor
+
+        Raises:
+            ValueError: If the level parameters do not have matching lengths.
+        """
+
+        energies = np.asarray(energies, dtype=float)
+        xpositions = np.asarray(xpositions, dtype=float)
+        if energies.shape != xpositions.shape or energies.ndim != 1:
+            raise ValueError("energies and xpositions must be 1-D and of equal length")
+        widths = np.broadcast_to(np.asarray(widths, dtype=float), energies.shape)
+
+        self._energies = energies
+        self._xpositions = xpositions
+        self._widths = widths
+
+        if text_kw is None:
+            text_kw = {}
+        n = len(energies)
+        no_text = ("",) * n
+        texts = [
+            no_text if t is None else t
+            for t in (right_text, left_text, top_text, bottom_text)
+        ]
+        if any(len(t) != n for t in texts):
+            raise ValueError("Level text must have one entry per level")
+        self.text_labels: List[Dict[str, mpl.text.Text]] = [
+            _level_labels(e, x, w, rt, lt, tt, bt, text_kw)
+            for e, x, w, rt, lt, tt, bt in zip(energies, xpositions, widths, *texts)
+        ]
+        """Text label objects of each level, keyed by side.
+        Sides without text are omitted."""
+
+        # match the end caps of EnergyLevel lines
+        kwargs.setdefault("capstyle", mpl.rcParams["lines.solid_capstyle"])
+        # (N, 2, 2) array of level line end points
+        segments = np.stack(
+            [
+                np.column_stack([xpositions - widths / 2, energies]),
+                np.column_stack([xpositions + widths / 2, energies]),
+            ],
+            axis=1,
+        )
+        # matplotlib's stubs only list sequences, but arrays are accepted
+        super().__init__(segments, **kwargs)  # type: ignore[arg-type]
+
+    @classmethod
+    def from_levels(
+        cls, levels: Collection[EnergyLevel], **kwargs
+    ) -> "EnergyLevelCollection":
+        """
+        Creates a collection from existing :class:`EnergyLevel` artists.
+
+        The color, alpha, linewidth, linestyle (including custom dashes),
+        and antialiasing of each level are kept,
+        and the existing text label objects are reused.
+        A collection is drawn as a single artist,
+        so it uses the highest zorder of the levels,
+        and the cap style of the first level
+        (its dashed cap style if all levels are dashed).
+        Other per-level :class:`~matplotlib:matplotlib.lines.Line2D` options,
+        like cap styles, markers, or path effects, are not carried over.
+        The levels themselves should not also be added to the axes.
+
+        Parameters:
+            levels (collection of EnergyLevel): Levels to collect
+            kwargs: Passed to the
+                :class:`matplotlib:matplotlib.collections.LineCollection` constructor
+
+        Returns:
+            EnergyLevelCollection: Collection drawing all of the levels
+        """
+
+        levels = list(levels)
+        if levels:
+            # collections have a single cap style, Line2D picks one by line style
+            if all(lev.is_dashed() for lev in levels):
+                kwargs.setdefault("capstyle", levels[0].get_dash_capstyle())
+            else:
+                kwargs.setdefault("capstyle", levels[0].get_solid_capstyle())
+        # alpha is per artist for Line2D, but per segment color for collections
+        kwargs.setdefault(
+            "colors",
+            [mpl.colors.to_rgba(lev.get_color(), lev.get_alpha()) for lev in levels],
+        )
+        kwargs.setdefault("linewidths", [lev.get_linewidth() for lev in levels])
+        # dash patterns keep custom dashes, which get_linestyle reports as '--'
+        kwargs.setdefault(
+            "linestyles",
+            [
+                getattr(lev, "_unscaled_dash_pattern", lev.get_linestyle())
+                for lev in levels
+            ],
+        )
+        kwargs.setdefault("antialiaseds", [lev.get_antialiased() for lev in levels])
+        kwargs.setdefault("zorder", max((lev.get_zorder() for lev in levels), default=2))
+        collection = cls(
+            [lev._energy for lev in levels],
+            [lev._xpos for lev in levels],
+            [lev._width for lev in levels],
+            **kwargs
+        )
+        collection.text_labels = [dict(lev.text_labels) for lev in levels]
+        return collection
+
+    def get_anchors(
+        self, loc: Union[Literal["center", "left", "right"], Collection] = "center"
+    ) -> np.ndarray:
+        """
+        Returns an anchor on every level of the collection in plot coordinates.
+
+        Parameters:
+            loc (str or array-like): What reference point to return.
+                `'center'`, `'left'`, `'right'` gives those points of each level.
+                Otherwise interpreted as offsets from the center location,
+                either a single 2-element offset or an (N, 2) array with one offset per level.
+
+        Returns:
+            numpy.ndarray: (N, 2) array of x,y coordinates
+
+        Raises:
+            TypeError: If `loc` is not an accepted string or an array of 2-element offsets.
+        """
+
+        if isinstance(loc, str):
+            if loc == "center":
+                x = self._xpositions
+            elif loc == "left":
+                x = self._xpositions - self._widths / 2
+            elif loc == "right":
+                x = self._xpositions + self._widths / 2
+            else:
+                raise TypeError("loc must be 'center', 'left', or 'right' if a string")
+            return np.column_stack([x, self._energies])
+
+        offsets = np.asarray(loc, dtype=float)
+        if offsets.shape[-1:] != (2,):
+            raise TypeError("loc must be 2-element offsets if not using keys")
+        anchors: np.ndarray = np.column_stack([self._xpositions, self._energies]) + offsets
+        return anchors
+
+    def _iter_labels(self):
+        for labels in self.text_labels:
+            yield from labels.items()
+
+    def get_children(self):
+        """
+        Overridden to include the text labels.
+        """
+        return [
+            *super().get_children(), *(label for _, label in self._iter_labels())
+        ]
+
+    def set_animated(self, b):
+        """
+        Overridden to also set the text labels as animated.
+        """
+        for _, label in self._iter_labels():
+            label.set_animated(b)
+        super().set_animated(b)
+
+    def set_figure(self, figure):
+        for _, label in self._iter_labels():
+            label.set_figure(figure)
+        super().set_figure(figure)
+
+    def set_transform(self, transform):
+        """
+        Overridden to add padding offsets to labels.
+        """
+        for side, label in self._iter_labels():
+            label.set_transform(transform + _label_offsets[side])
+        super().set_transform(transform)
+
+    def draw(self, renderer):
+
+        super().draw(renderer)
+        for _, label in self._iter_labels():
+            label.draw(renderer)
+
+
 class Coupling(Line2D):
     """
     Coupling artist for showing couplings between levels.
@@ -194,6 +545,16 @@ class Coupling(Line2D):
     the other artists are rendered whenever the main artist is rendered.
     """
 
+    _bbox_defaults = MappingProxyType(
+        {
+            "boxstyle": "round,pad=0.05",
+            "fc": "w",
+            "ec": "none",
+            "alpha": 0.5,
+        }
+    )
+    "Default soft background for the label text, read-only"
+
     def __str__(self) -> str:
 
         return "Coupling((%g,%g)->(%g,%g))" % (*self._start, *self._stop)
@@ -256,22 +617,22 @@ class Coupling(Line2D):
                 the arrowhead to avoid extra lines.
         """
 
-        if not isinstance(start, Collection) or not isinstance(stop, Collection):
-            raise RuntimeError("x/y data must be a sequence of two elements")
-        elif len(start) != 2 or len(stop) != 2:
-            raise RuntimeError("x/y data must be a sequence of two elements")
+        # validate before anything else is set up
+        start = _endpoint_array(start)
+        stop = _endpoint_array(stop)
 
         if arrow_kw is None:
             arrow_kw = {}
         if label_kw is None:
             label_kw = {}
 
-        self._start = np.array(start)
-        self._stop = np.array(stop)
+        # avoid copying inputs that are already float arrays
+        self._start = start
+        self._stop = stop
         self._arrowsize = arrowsize
         self._arrowratio = arrowratio
         self._tail = tail
-        self.tail = False
+        self.tail: Union[mpl.patches.Polygon, Literal[False]] = False
 
         self._deflection = deflection
         self._deflect = not np.isclose(deflection, 0.0)
@@ -281,6 +642,10 @@ class Coupling(Line2D):
 
         # set number of points to use when drawing lines
         self.npts = 100
+        # points per half-period when drawing wavy lines
+        self.npts_halfperiod = 20
+        # upper limit on the points used for very long wavy lines
+        self.npts_max = 2000
 
         if arrowsize * arrowratio < waveamp:
             warnings.warn(
@@ -288,11 +653,13 @@ class Coupling(Line2D):
             )
 
         x0, y0 = self.init_path()
+        self._update_geometry()
         super().__init__(x0, y0, **kwargs)
 
         # initialize arrowheads
         # use line kwargs to set arrow defaults
-        arrow_kw.update(kwargs)
+        # merge into a new dict so the caller's arrow_kw is not modified
+        arrow_kw = {**arrow_kw, **kwargs}
         # use facecolor instead of color
         color = arrow_kw.pop("color", None)
         if color is not None:
@@ -302,7 +669,10 @@ class Coupling(Line2D):
         # initialize label text
         self.init_label(label, label_offset, label_rot, label_flip, **label_kw)
 
-    def init_path(self) -> Tuple[np.ndarray, np.ndarray]:
+        # sub-artists, in draw order
+        self._children = [c for c in (self.head, self.tail, self.text) if c]
+
+    def init_path(self) -> Tuple[_Points, _Points]:
         """
         Calculates the desired path for the line of the coupling.
 
@@ -314,16 +684,14 @@ class Coupling(Line2D):
 
         Returns
         -------
-        x: numpy.ndarray
+        x: numpy.ndarray or tuple
             x-coordinates of the data points for the un-rotated, un-translated path
-        y: numpy.ndarray
+        y: numpy.ndarray or tuple
             y-coordinates of the data points for the un-rotated, un-translated path
         """
 
-        vec = self._stop - self._start
-        dist = np.sqrt(vec.dot(vec))
+        dist, self._ang = _geometry(self._start, self._stop)
         self._dist = dist
-        self._ang = np.arctan2(*vec[::-1])
 
         h = self._deflection
 
@@ -350,36 +718,99 @@ class Coupling(Line2D):
             self._phi_shim = phi - theta_shim/2
 
             if self._tail:
-                thetas = np.linspace(theta_shim, theta_center-theta_shim, self.npts)
                 theta0 = theta_center-theta_shim*2
+                npts = max(self.npts, self._num_points(abs(r*theta0)))
+                thetas = np.linspace(theta_shim, theta_center-theta_shim, npts)
             else:
-                thetas = np.linspace(0, theta_center - theta_shim, self.npts)
                 theta0 = theta_center-theta_shim
-
-            xc = ((r+self._waveamp*
-                   np.sin(omega*r*theta_center*thetas/theta0))
-                  * np.sin(thetas-phi)
-                  + r*np.sin(phi))
-            yc = ((r+self._waveamp*
-                  np.sin(omega*r*theta_center*thetas/theta0))
-                  * np.cos(thetas-phi)
-                  - r*np.cos(phi))
+                npts = max(self.npts, self._num_points(abs(r*theta0)))
+                thetas = np.linspace(0, theta_center - theta_shim, npts)
+
+            # radius modulated by the wave, shared by both coordinates
+            rc = _sine_wave(thetas, omega*r*theta_center/theta0, 0.0, self._waveamp)
+            rc += r
+            xc = rc * np.sin(thetas-phi) + r*np.sin(phi)
+            yc = rc * np.cos(thetas-phi) - r*np.cos(phi)
         
             return xc, yc
         
+        elif self._waveamp == 0 or omega == 0:
+
+            # straight line only needs its end points
+            x_ends = (self._arrowsize if self._tail else 0.0, dist - self._arrowsize)
+            y_ends = (0.0, 0.0)
+
+            return x_ends, y_ends
+
         else:
             
             if self._tail:
-                x0 = np.linspace(self._arrowsize, dist - self._arrowsize, self.npts)
+                x_start = self._arrowsize
                 op0 = omega * self._arrowsize*2
             else:
-                x0 = np.linspace(0, dist - self._arrowsize, self.npts)
+                x_start = 0.0
                 op0 = omega * self._arrowsize
+            x_stop = dist - self._arrowsize
+            npts = self._num_points(x_stop - x_start)
+            # equivalent to linspace, but scaled in place in a single buffer
+            x0 = np.arange(npts, dtype=float)
+            x0 *= (x_stop - x_start) / (npts - 1)
+            x0 += x_start
+            x0[-1] = x_stop
                 
-            y0 = self._waveamp * np.sin(omega*x0 + op0)
+            y0 = _sine_wave(x0, omega, op0, self._waveamp)
                 
             return x0, y0
 
+    def _num_points(self, length: float) -> int:
+        """
+        Number of points to sample a path of the given length with.
+
+        Wavy paths scale the number of points with the number of half-periods
+        along the path so short couplings aren't oversampled
+        and long couplings aren't undersampled.
+        This count is rounded up to a multiple of 16,
+        and limited to :attr:`npts_max` points.
+        Other paths use :attr:`npts` points.
+
+        Parameters:
+            length (float): Length of the path to sample, in data coordinates.
+
+        Returns:
+            int: Number of points to use
+        """
+
+        if self._waveamp == 0 or self._halfperiod == 0:
+            return self.npts
+        npts = max(16, int(self.npts_halfperiod * length / self._halfperiod))
+        # round up to a multiple of 16, so nearby lengths share a point count
+        return min((npts + 15) & ~15, self.npts_max)
+
+    def _update_geometry(self):
+        """
+        Caches the local transforms that place the coupling path, arrowheads,
+        and label so they are not rebuilt on every transform update.
+
+        Must be called whenever the start, stop, or arrowsize of the coupling change.
+        """
+
+        # axis-aligned couplings (common between stacked levels) get exact values
+        cos, sin = _axis_cos_sin.get(self._ang) or (
+            math.cos(self._ang), math.sin(self._ang)
+        )
+        # each transform is a uniform scale, then rotation, then translation,
+        # so the matrices can be written down directly
+        hc, hs = self._arrowsize * cos, self._arrowsize * sin
+        x0, y0 = self._start
+        x1, y1 = self._stop
+        self._head_transform = affine.from_values(hc, hs, -hs, hc, x1, y1)
+        # negative scale is equivalent to an extra rotation by pi
+        self._tail_transform = affine.from_values(-hc, -hs, hs, -hc, x0, y0)
+        # used by the line and the label
+        self._line_transform = affine.from_values(cos, sin, -sin, cos, x0, y0)
+        # force children to be updated on next set_transform
+        self._last_transform = None
+
     def init_arrowheads(self, **kwargs):
         """
         Creates the arrowhead(s) for the coupling as matplotlib polygon objects.
@@ -389,22 +820,25 @@ class Coupling(Line2D):
                 :class:`matplotlib:matplotlib.patches.Polygon` constructor.
         """
 
-        verts0 = np.array([[-1, 0.5], [-1, -0.5], [0, 0], [-1, 0.5]])
+        verts_head, verts_tail = self._arrowhead_verts()
+        self.head = mpl.patches.Polygon(verts_head, closed=False, **kwargs)
+        if self._tail:
+            self.tail = mpl.patches.Polygon(verts_tail, closed=False, **kwargs)
+
+    def _arrowhead_verts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vertices of the head and tail arrowheads, before transforms are applied.
+        """
+
         # set aspect ratio of arrow
-        verts0[:,1] *= self._arrowratio
-        
+        verts0 = _arrow_verts * (1, self._arrowratio)
         if self._deflect:
-            verts_head = verts0 @ self._rotation_matrix(self._phi_shim)
-            self.head = mpl.patches.Polygon(verts_head, closed=False, **kwargs)
-            if self._tail:
-                verts_tail = verts0 @ self._rotation_matrix(-self._phi_shim)
-                self.tail = mpl.patches.Polygon(verts_tail, closed=False, **kwargs)
-                
-        else:
-            self.head = mpl.patches.Polygon(verts0, closed=False, **kwargs)
-            
-            if self._tail:
-                self.tail = mpl.patches.Polygon(verts0, closed=False, **kwargs)
+            # rotate to follow the curved path
+            return (
+                verts0 @ self._rotation_matrix(self._phi_shim),
+                verts0 @ self._rotation_matrix(-self._phi_shim),
+            )
+        return verts0, verts0
 
     def _rotation_matrix(self, theta):
         
@@ -434,16 +868,8 @@ class Coupling(Line2D):
                 :class:`matplotlib:matplotlib.text.Text` constructor.
         """
 
-        # define default softbackground for text
-        bbox_defaults = {
-            "boxstyle": "round,pad=0.05",
-            "fc": "w",
-            "ec": "none",
-            "alpha": 0.5,
-        }
-        bbox_dict = label_kw.pop("bbox", {})
-        bbox_dict = deep_update(bbox_defaults, bbox_dict)
-        label_kw["bbox"] = bbox_dict
+        # bbox has no nested options, so a shallow merge suffices
+        label_kw["bbox"] = {**self._bbox_defaults, **label_kw.pop("bbox", {})}
 
         if label_offset == "center":
             label_ha = "center"
@@ -464,64 +890,97 @@ class Coupling(Line2D):
         )
         # give space for non-centered text
         self.text_shift = np.array([0, 0])
-        if not label_rot:
+        # only look up the font size when the label needs padding
+        if label_ha != "center" and not label_rot:
             pad = self.text.get_fontsize() / 2  # in points
-        else:
-            pad = 0
-        if label_ha == "left":
-            self.text_shift[0] += pad
-        elif label_ha == "right":
-            self.text_shift[0] -= pad
+            if label_ha == "left":
+                self.text_shift[0] += pad
+            else:
+                self.text_shift[0] -= pad
+        # want to translate text shim in points
+        self._text_shim = affine().translate(*self.text_shift).frozen()
 
-    def set_figure(self, figure):
+    def set_endpoints(self, start: Collection, stop: Collection):
+        """
+        Moves the coupling to new start and stop locations.
 
-        self.head.set_figure(figure)
+        The path, arrowheads, and label are updated in place,
+        so couplings can be changed interactively without being recreated.
+
+        Parameters:
+            start (2-element collection): Coupling start location in data coordinates
+            stop (2-element collection): Coupling end location in data coordinates
+
+        Raises:
+            RuntimeError: If `start` or `stop` is not a collection of two elements.
+        """
+
+        # validate both before changing anything
+        start = _endpoint_array(start)
+        stop = _endpoint_array(stop)
+        self._start = start
+        self._stop = stop
+
+        # parent transform is forgotten when the geometry changes
+        parent_transform = self._last_transform
+        x0, y0 = self.init_path()
+        self._update_geometry()
+        self.set_data(x0, y0)
+
+        verts_head, verts_tail = self._arrowhead_verts()
+        self.head.set_xy(verts_head)
         if self.tail:
-            self.tail.set_figure(figure)
-        self.text.set_figure(figure)
+            self.tail.set_xy(verts_tail)
+        self.text.set_position((self._dist / 2, self._deflection))
+
+        if parent_transform is not None:
+            self.set_transform(parent_transform)
+        self.stale = True
+
+    def set_figure(self, figure):
+
+        for child in self._children:
+            child.set_figure(figure)
         super().set_figure(figure)
 
     def set_axes(self, axes):
 
-        self.head.set_axes(axes)
-        if self.tail:
-            self.tail.set_axes(axes)
-        self.text.set_axes(axes)
+        for child in self._children:
+            child.set_axes(axes)
         super().set_axes(axes)
 
+    def get_children(self):
+        """
+        Overridden to include the arrowhead(s) and label.
+        """
+        return [*super().get_children(), *self._children]
+
+    def set_animated(self, b):
+        """
+        Overridden to also set the arrowhead(s) and label as animated.
+        """
+        for child in self._children:
+            child.set_animated(b)
+        super().set_animated(b)
+
     def set_transform(self, transform):
 
-        head_transform = (
-            affine()
-            .scale(self._arrowsize, self._arrowsize)
-            .rotate(self._ang)
-            .translate(*self._stop)
-        )
-        self.head.set_transform(head_transform + transform)
+        # composed transforms are already up to date
+        if transform is self._last_transform:
+            return
+        self._last_transform = transform
 
+        self.head.set_transform(self._head_transform + transform)
         if self.tail:
-            tail_transform = (
-                affine()
-                .scale(self._arrowsize, self._arrowsize)
-                .rotate(self._ang + np.pi)
-                .translate(*self._start)
-            )
-            self.tail.set_transform(tail_transform + transform)
+            self.tail.set_transform(self._tail_transform + transform)
 
-        # want to translate text shim in points
-        text_shim = affine().translate(*self.text_shift)
         # want main translate in 'data' coords
-        text_transform = affine().rotate(self._ang).translate(*self._start)
-        self.text.set_transform(text_transform + transform + text_shim)
+        self.text.set_transform(self._line_transform + transform + self._text_shim)
 
-        # lw_shim = affine().scale(
-        line_transform = affine().rotate(self._ang).translate(*self._start)
-        super().set_transform(line_transform + transform)
+        super().set_transform(self._line_transform + transform)
 
     def draw(self, renderer):
 
         super().draw(renderer)
-        self.head.draw(renderer)
-        if self.tail:
-            self.tail.draw(renderer)
-        self.text.draw(renderer)
+        for child in self._children:
+            child.draw(renderer)
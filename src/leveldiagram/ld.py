@@ -2,14 +2,15 @@
 Base Level Diagram class
 """
 
-import matplotlib.pyplot as plt
-
-from typing import Dict, Tuple, Optional, Literal, Any
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Optional, Literal, Any, Collection
 from networkx import DiGraph
 from matplotlib.axes import Axes
+from matplotlib.artist import Artist
 
-from .utils import deep_update, ket_str
-from .artists import EnergyLevel, Coupling
+from .utils import _merge_defaults, ket_str
+from .artists import EnergyLevel, EnergyLevelCollection, Coupling
 
 
 class LD:
@@ -45,17 +46,21 @@ class LD:
         :alt: Basic 3-level diagram with 2 couplings using all default settings
     """
 
-    _level_defaults = {"width": 1, "color": "k", "text_kw": {"fontsize": "large"}}
-    "EnergyLevel default parameters dictionary"
+    _level_defaults = MappingProxyType(
+        {"width": 1, "color": "k", "text_kw": {"fontsize": "large"}}
+    )
+    "EnergyLevel default parameters dictionary, read-only"
 
-    _coupling_defaults = {"arrowsize": 0.15, "label_kw": {"fontsize": "large"}}
-    "Coupling default parameters dictionary"
+    _coupling_defaults = MappingProxyType(
+        {"arrowsize": 0.15, "label_kw": {"fontsize": "large"}}
+    )
+    "Coupling default parameters dictionary, read-only"
 
-    _wavy_defaults = {"waveamp": 0.05, "halfperiod": 0.1}
-    "Default parameters for a wavy coupling"
+    _wavy_defaults = MappingProxyType({"waveamp": 0.05, "halfperiod": 0.1})
+    "Default parameters for a wavy coupling, read-only"
 
-    _deflection_defaults = {"deflection": 0.25}
-    "Default parameters for a deflection"
+    _deflection_defaults = MappingProxyType({"deflection": 0.25})
+    "Default parameters for a deflection, read-only"
 
     def __init__(
         self,
@@ -69,6 +74,7 @@ class LD:
         wavy_defaults: Optional[Dict[str, Any]] = None,
         deflection_defaults: Optional[Dict[str, Any]] = None,
         use_ld_kw: bool = False,
+        collect_levels: bool = False,
     ):
         """
         Parameters
@@ -123,9 +129,26 @@ class LD:
             Deflection specific :class:`~.Coupling` default values for whole diagram.
             Provided values override class defaults.
             If None, use class defaults.
+        use_ld_kw: bool, optional
+            Read leveldiagram parameters from the `'ld_kw'` key of each node and edge
+            instead of from the node and edge attributes directly.
+            Default is False.
+        collect_levels: bool, optional
+            Draw all levels as a single :class:`~.EnergyLevelCollection`
+            instead of one :class:`~.EnergyLevel` artist per level.
+            This is faster to draw for diagrams with many levels.
+            The individual levels are still generated and stored in :attr:`levels`.
+            Only the per-level options supported by
+            :meth:`~.EnergyLevelCollection.from_levels` are kept;
+            the collection uses the highest level zorder,
+            and options like cap styles, markers, or path effects are lost.
+            Default is False.
         """
 
         if ax is None:
+            # pyplot is only needed to make a figure, avoid the backend setup otherwise
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots(1)
             ax.set_aspect("equal")
         self.fig = ax.get_figure()
@@ -138,108 +161,165 @@ class LD:
         # control parameters
         self.default_label = default_label
         self.use_ld_kw = use_ld_kw
+        self.collect_levels = collect_levels
 
         # save default options for artists
-        if level_defaults is None:
-            self.level_defaults = self._level_defaults
-        else:
-            self.level_defaults = deep_update(self._level_defaults, level_defaults)
-
-        if coupling_defaults is None:
-            self.coupling_defaults = self._coupling_defaults
-        else:
-            self.coupling_defaults = deep_update(
-                self._coupling_defaults, coupling_defaults
-            )
-
-        if wavy_defaults is None:
-            self.wavy_defaults = self._wavy_defaults
-        else:
-            self.wavy_defaults = deep_update(
-                self._wavy_defaults, wavy_defaults
-            )
-
-        if deflection_defaults is None:
-            self.deflection_defaults = self._deflection_defaults
-        else:
-            self.deflection_defaults = deep_update(
-                self._deflection_defaults, deflection_defaults
-            )
+        # class defaults are read-only templates, so each instance gets its own
+        # copy, nested dicts included, before applying any overrides
+        self.level_defaults = _merge_defaults(
+            deepcopy(dict(self._level_defaults)), level_defaults or {}
+        )
+        self.coupling_defaults = _merge_defaults(
+            deepcopy(dict(self._coupling_defaults)), coupling_defaults or {}
+        )
+        self.wavy_defaults = _merge_defaults(
+            deepcopy(dict(self._wavy_defaults)), wavy_defaults or {}
+        )
+        self.deflection_defaults = _merge_defaults(
+            deepcopy(dict(self._deflection_defaults)), deflection_defaults or {}
+        )
 
         # internal storage objects
         self.levels: Dict[int, EnergyLevel] = {}
         """Stores levels to be drawn"""
         self.couplings: Dict[Tuple[int, int], Coupling] = {}
         """Stores couplings to be drawn"""
+        self.level_collection: Optional[EnergyLevelCollection] = None
+        """Collection drawing the levels, if `collect_levels` is True"""
+        self._coupling_endpoints: Dict[Tuple[int, int], Tuple[Any, Any]] = {}
+        # artists are only regenerated when marked dirty
+        self._levels_dirty = True
+        self._couplings_dirty = True
+        # nodes and edges of the graph when last drawn
+        self._graph_fingerprint: Optional[Tuple[tuple, tuple]] = None
+        self._drawn_artists: List[Artist] = []
+        self._blit_edges: Optional[Tuple[Tuple[int, int], ...]] = None
+        # saved canvas region, its type depends on the backend
+        self._blit_background: Any = None
+        self._blit_cid: Optional[int] = None
+        self._blit_capturing = False
 
     def generate_levels(self):
         """
         Creates the EnergyLevel artists from the graph nodes.
 
         They are saved to the :attr:`levels` dictionary.
+        This does nothing if the levels have already been generated,
+        unless :meth:`invalidate` has been called since.
         """
 
-        for i, n in enumerate(self._graph.nodes):
-            if self.use_ld_kw:
-                node = self._graph.nodes[n].get('ld_kw', {}).copy()
-            else:
-                node = self._graph.nodes[n].copy()
+        if not self._levels_dirty:
+            return
+        self.levels.clear()
+        # couplings are anchored to the old levels
+        self._couplings_dirty = True
+
+        # bind loop invariants to locals
+        levels = self.levels
+        level_defaults = self.level_defaults
+        use_ld_kw = self.use_ld_kw
+        default_label = None if self.default_label == "none" else self.default_label
+
+        for i, (n, data) in enumerate(self._graph.nodes(data=True)):
+            if use_ld_kw:
+                data = data.get('ld_kw', {})
+            # set default options, merging into a new dict leaves the graph untouched
+            # nodes without options, the common case, only need a copy of the defaults
+            node = _merge_defaults(level_defaults, data) if data else {**level_defaults}
             # if x,y coords not defined, set using node index
-            node.setdefault("energy", i)
-            node.setdefault("xpos", i)
+            if "energy" not in data:
+                node["energy"] = i
+            if "xpos" not in data:
+                node["xpos"] = i
+
+            if default_label is not None and default_label not in data:
+                node[default_label] = ket_str(n)
 
-            if self.default_label != "none":
-                node.setdefault(self.default_label, ket_str(n))
+            levels[n] = EnergyLevel(**node)
 
-            # set default options
-            node = deep_update(self.level_defaults, node)
-            self.levels[n] = EnergyLevel(**node)
+        self._levels_dirty = False
 
     def generate_couplings(self):
         """
         Creates the Coupling and WavyCoupling artisits from the graph edges.
 
         They are saved to the :attr:`couplings` dictionary.
+        This does nothing if the couplings have already been generated,
+        unless :meth:`invalidate` has been called since.
         """
 
-        for ed in self._graph.edges:
-            if self.use_ld_kw:
-                edge = self._graph.edges[ed].get("ld_kw", {}).copy()
-            else:
-                edge = self._graph.edges[ed].copy()
+        if not self._couplings_dirty:
+            return
+        self.couplings.clear()
+        self._coupling_endpoints.clear()
+
+        # bind loop invariants to locals, resolving the axes color cycler once
+        get_next_color = self.ax._get_lines.get_next_color
+        levels = self.levels
+        couplings = self.couplings
+        endpoints = self._coupling_endpoints
+        coupling_defaults = self.coupling_defaults
+        use_ld_kw = self.use_ld_kw
+        # merged defaults per (wavy, deflect) combination, built on first use
+        templates = {}
+
+        for u, v, data in self._graph.edges(data=True):
+            ed = (u, v)
+            if use_ld_kw:
+                data = data.get("ld_kw", {})
             # skip if hidden
-            if edge.pop("hidden", False):
+            if data.get("hidden", False):
                 continue
-            # set default options
-            edge = deep_update(self.coupling_defaults, edge)
+            wavy = bool(data.get("wavy", coupling_defaults.get("wavy", False)))
+            deflect = bool(data.get("deflect", coupling_defaults.get("deflect", False)))
+            template = templates.get((wavy, deflect))
+            if template is None:
+                template = coupling_defaults
+                if wavy:
+                    template = _merge_defaults(self.wavy_defaults, template)
+                if deflect:
+                    template = _merge_defaults(self.deflection_defaults, template)
+                templates[wavy, deflect] = template
+            # set default options in one merge, into a new dict leaving the graph untouched
+            edge = _merge_defaults(template, data)
             # pop off non-arguments
+            edge.pop("hidden", None)
+            edge.pop("wavy", None)
+            edge.pop("deflect", None)
             det = edge.pop("detuning", 0)
             start_anchor = edge.pop("start_anchor", "center")
             stop_anchor = edge.pop("stop_anchor", "center")
             # set where couplings join the levels
-            start = self.levels[ed[0]].get_anchor(start_anchor)
-            stop = self.levels[ed[1]].get_anchor(stop_anchor)
-            # adjust for detuning
-            stop[1] -= det
-            edge.setdefault("start", start)
-            edge.setdefault("stop", stop)
-            # auto-cycle colors
-            if "color" not in edge:
-                edge["color"] = self.ax._get_lines.get_next_color()
-
-            wavy = edge.pop("wavy", False)
-            deflect = edge.pop("deflect", False)
-            if wavy:
-                edge = deep_update(self.wavy_defaults, edge)
-            if deflect:
-                edge = deep_update(self.deflection_defaults, edge)
-                
-            self.couplings[ed] = Coupling(**edge)
+            start = levels[u].get_anchor(start_anchor)
+            stop = levels[v].get_anchor(stop_anchor)
+            start = edge.setdefault("start", start)
+            if "stop" in edge:
+                # explicit stops are drawn as given, so treat them as already detuned
+                stop = edge["stop"]
+                stop = (stop[0], stop[1] + det)
+            else:
+                # adjust for detuning
+                edge["stop"] = (stop[0], stop[1] - det)
+            # remember undetuned end points for set_detuning
+            endpoints[ed] = (start, stop)
+            # auto-cycle colors, also when explicitly set to None
+            if edge.get("color") is None:
+                edge["color"] = get_next_color()
+
+            couplings[ed] = Coupling(**edge)
+
+        self._couplings_dirty = False
 
     def draw(self):
         """
         Add artists to the figure.
 
+        Levels and couplings are only generated and added to the axes once.
+        Calling this again only rescales the view,
+        unless :meth:`invalidate` has been called
+        or nodes or edges have been added to or removed from the graph,
+        in which case the previously drawn artists are replaced.
+
         This calls :meth:`matplotlib:matplotlib.axes.Axes.autoscale_view` to ensure
         plot ranges are increased to account for objects.
 
@@ -247,17 +327,171 @@ class LD:
         labels near edges of the plot.
         """
 
-        self.generate_levels()
-        self.generate_couplings()
+        # check for added or removed nodes and edges, attribute edits still need invalidate()
+        # order matters, it sets default level positions and coupling colors
+        fingerprint = (tuple(self._graph.nodes), tuple(self._graph.edges))
+        if fingerprint != self._graph_fingerprint:
+            self.invalidate()
+            self._graph_fingerprint = fingerprint
+
+        # artists taken off the axes, e.g. by Axes.cla, cannot be re-added
+        if any(artist.axes is not self.ax for artist in self._drawn_artists):
+            self.invalidate()
+
+        if self._levels_dirty or self._couplings_dirty or not self._drawn_artists:
+            # replace any previously drawn artists still on the axes
+            for artist in self._drawn_artists:
+                if artist.axes is self.ax:
+                    artist.remove()
+            self._drawn_artists = []
+            self._blit_edges = None
+            self._blit_background = None
+
+            self.generate_levels()
+            self.generate_couplings()
+            self._add_artists()
+
+        self.ax.autoscale_view()
+
+    def invalidate(self):
+        """
+        Marks the levels and couplings to be regenerated on the next :meth:`draw`.
+
+        Call this after changing node or edge attributes of the graph,
+        or the default parameters, of an already drawn diagram.
+        Adding or removing nodes or edges is detected by :meth:`draw`.
+        """
+
+        self._levels_dirty = True
+        self._couplings_dirty = True
+
+    def _add_artists(self):
+        """
+        Adds the generated levels, their labels, and the couplings to the axes.
+        """
+
+        if self.collect_levels:
+            self.level_collection = EnergyLevelCollection.from_levels(
+                list(self.levels.values())
+            )
+            self.ax.add_collection(self.level_collection)
+            self._drawn_artists.append(self.level_collection)
+        else:
+            for lev in self.levels.values():
+                self.ax.add_line(lev)
+                self._drawn_artists.append(lev)
 
         for lev in self.levels.values():
-            self.ax.add_line(lev)
             for _, text in lev.text_labels.items():
                 # registers text labels as artists on the axes
                 # ensures text doesn't get clipped by figure edges
                 self.ax._add_text(text)
+                self._drawn_artists.append(text)
 
         for coupling in self.couplings.values():
             self.ax.add_line(coupling)
+            self._drawn_artists.append(coupling)
 
-        self.ax.autoscale_view()
+    def set_detuning(self, edge: Tuple[int, int], detuning: float):
+        """
+        Changes the detuning of a coupling in place.
+
+        The coupling artist is updated without regenerating the diagram.
+        Use :meth:`blit_couplings` to quickly redraw it,
+        e.g. when animating a detuning sweep.
+
+        Parameters:
+            edge: Graph edge of the coupling to change.
+            detuning: New detuning of the coupling from the transition,
+                in x-coordinate units.
+        """
+
+        start, stop = self._coupling_endpoints[edge]
+        self.couplings[edge].set_endpoints(start, (stop[0], stop[1] - detuning))
+
+    def blit_couplings(self, edges: Collection[Tuple[int, int]]):
+        """
+        Redraws only the given couplings, using blitting.
+
+        On the first call for a set of edges, those couplings are marked as animated
+        and the rest of the figure is drawn once and the axes cached as a background.
+        Subsequent calls with the same edges restore the cached background
+        and only draw those couplings,
+        which is much faster than a full redraw when animating couplings.
+        Animated couplings are still drawn by full redraws of the figure,
+        like resizing or :meth:`~matplotlib:matplotlib.figure.Figure.savefig`,
+        after which the next call captures a new background.
+
+        Passing no edges stops blitting:
+        all couplings are drawn normally again.
+
+        Falls back to a normal redraw if the canvas does not support blitting.
+
+        Parameters:
+            edges: Graph edges of the couplings to redraw.
+        """
+
+        # blitting methods are only defined by canvases that support it
+        canvas: Any = self.ax.figure.canvas
+        edges = tuple(edges)
+        if not edges:
+            self._stop_blit(canvas)
+            return
+        if not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+
+        if edges != self._blit_edges or self._blit_background is None:
+            for ed, coupling in self.couplings.items():
+                coupling.set_animated(ed in edges)
+            self._blit_edges = edges
+            if self._blit_cid is None:
+                self._blit_cid = canvas.mpl_connect("draw_event", self._on_blit_draw)
+            # animated couplings are skipped by a full draw, capture the rest
+            self._blit_capturing = True
+            try:
+                canvas.draw()
+            finally:
+                self._blit_capturing = False
+            self._blit_background = canvas.copy_from_bbox(self.ax.bbox)
+        else:
+            canvas.restore_region(self._blit_background)
+        self._draw_blit_couplings()
+        canvas.blit(self.ax.bbox)
+        canvas.flush_events()
+
+    def _stop_blit(self, canvas):
+        """
+        Un-animates the couplings and disconnects the blitting draw callback.
+        """
+
+        for coupling in self.couplings.values():
+            coupling.set_animated(False)
+        if self._blit_cid is not None:
+            canvas.mpl_disconnect(self._blit_cid)
+            self._blit_cid = None
+        self._blit_edges = None
+        self._blit_background = None
+        canvas.draw_idle()
+
+    def _draw_blit_couplings(self):
+        """
+        Draws the couplings being blitted onto the canvas.
+        """
+
+        for ed in self._blit_edges or ():
+            self.ax.draw_artist(self.couplings[ed])
+
+    def _on_blit_draw(self, event):
+        """
+        Draws the animated couplings during full figure draws, e.g. on resize or save.
+        """
+
+        # full draws made while capturing the background must not include the couplings
+        if self._blit_edges is None or self._blit_capturing:
+            return
+        # other full draws (resize, savefig) skip animated couplings, so draw them here
+        for ed in self._blit_edges:
+            self.couplings[ed].draw(event.renderer)
+        # the cached background may no longer match the canvas
+        self._blit_background = None
@@ -4,12 +4,27 @@ Miscellaneous utility functions
 
 import platform
 from importlib.metadata import version
-from collections.abc import Sequence
+from collections.abc import Sequence, Mapping
 import re
+import functools
 
 from typing import Any
 
 seq_contents = r"[\(|\[\{](.*)[\)|\]\}]"
+_seq_contents_re = re.compile(seq_contents)
+
+
+@functools.lru_cache(maxsize=512)
+def _seq_str(in_s: str) -> str:
+    """
+    Strip the outer container brackets from the string representation of a Sequence.
+
+    Cached on the string representation, since the same labels are
+    formatted every time a diagram is drawn.
+    """
+    # use regex to handle more complex things like namedtuples
+    return _seq_contents_re.search(in_s).group(1)
+
 
 def ket_str(s: Any) -> str:
     """
@@ -31,10 +46,9 @@ def ket_str(s: Any) -> str:
 
     if not isinstance(s, str) and isinstance(s, Sequence):
         # if sequence, but not string or dict, drop brackets in display
-        # use regex to handle more complex things like namedtuples
-        in_s = re.search(seq_contents, in_s).group(1)
+        in_s = _seq_str(in_s)
 
-    out_s = "$\\left|" + in_s + "\\right\\rangle$"
+    out_s = f"$\\left|{in_s}\\right\\rangle$"
 
     return out_s
 
@@ -59,10 +73,9 @@ def bra_str(s: Any) -> str:
 
     if not isinstance(s, str) and isinstance(s, Sequence):
         # if sequence, but not string or dict, drop brackets in display
-        # use regex to handle more complex things like namedtuples
-        in_s = re.search(seq_contents, in_s).group(1)
+        in_s = _seq_str(in_s)
 
-    out_s = "$\\left\\langle" + in_s + "\\right|$"
+    out_s = f"$\\left\\langle{in_s}\\right|$"
 
     return out_s
 
@@ -90,6 +103,27 @@ def deep_update(mapping: dict, *updating_mappings: dict) -> dict:
     return updated_mapping
 
 
+def _merge_defaults(defaults: Mapping, override: Mapping) -> dict:
+    """
+    Helper function to overlay options on a default parameters dictionary.
+
+    Equivalent to :func:`deep_update` for a single override,
+    but avoids calls and copies for the common case of top-level keys.
+    Nested dictionaries present in both inputs are deep-updated,
+    so options like `label_kw['bbox']` merge at every level.
+
+    Returns:
+        dict: Updated copy of `defaults`
+    """
+    out = {**defaults}
+    for k, v in override.items():
+        if isinstance(v, dict) and isinstance(out.get(k), dict):
+            out[k] = deep_update(out[k], v)
+        else:
+            out[k] = v
+    return out
+
+
 def about():
     """
     Display version of leveldiagram and critical dependencies.